@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import os
+from pathlib import Path
+import yaml
+import json
+import hashlib
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Environment variables with validation
+CHANGE_FEED_DIR = os.getenv('CHANGE_FEED_DIR')
+OUTPUT_DIR = os.getenv('OUTPUT_DIR')
+
+if not CHANGE_FEED_DIR:
+    logger.error("Error: CHANGE_FEED_DIR environment variable is not set.")
+    sys.exit(1)
+if not OUTPUT_DIR:
+    logger.error("Error: OUTPUT_DIR environment variable is not set.")
+    sys.exit(1)
+if not os.path.isdir(CHANGE_FEED_DIR):
+    logger.error(f"Error: Change feed directory {CHANGE_FEED_DIR} does not exist or is not mounted.")
+    sys.exit(1)
+
+# Records the sequence of the last change feed applied to the mirror
+CURSOR_FILE_NAME = '.change_feed_cursor'
+
+def compute_entity_hash(document):
+    """Compute a stable content hash for a catalog document."""
+    canonical = json.dumps(document, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def unescape_pointer_token(token):
+    """Unescape a JSON Pointer path token (RFC 6901)."""
+    return token.replace('~1', '/').replace('~0', '~')
+
+def apply_patch(document, patch):
+    """Apply JSON Patch operations (RFC 6902) produced by the converters to a document."""
+    for operation in patch:
+        tokens = [unescape_pointer_token(token) for token in operation['path'].split('/')[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[token]
+        if operation['op'] == 'remove':
+            del parent[tokens[-1]]
+        elif operation['op'] in ['add', 'replace']:
+            parent[tokens[-1]] = operation['value']
+        else:
+            raise ValueError(f"Unsupported patch operation: {operation['op']}")
+    return document
+
+def entity_file(entity_ref):
+    """Map an entity reference (e.g., 'component:authorization-service') to its catalog file."""
+    kind, name = entity_ref.split(':', 1)
+    return Path(OUTPUT_DIR) / f"{kind}s" / f"{name}.yaml"
+
+def read_entity(output_file, entity_ref, expected_hash):
+    """Read the mirrored document for an entity and check it matches the expected hash."""
+    if not output_file.is_file():
+        raise ValueError(f"{entity_ref} is not present in {OUTPUT_DIR}")
+    with open(output_file, 'r') as f:
+        document = yaml.safe_load(f)
+    if compute_entity_hash(document) != expected_hash:
+        raise ValueError(f"{entity_ref} in {OUTPUT_DIR} has drifted from the previous snapshot")
+    return document
+
+def write_entity(output_file, document):
+    """Write a catalog document to the mirror."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w') as f:
+        yaml.dump(document, f, default_flow_style=False)
+
+def apply_change(change):
+    """Apply a single change record to the mirrored catalog, skipping changes already applied."""
+    entity_ref = change['entityRef']
+    output_file = entity_file(entity_ref)
+    if change['action'] == 'removed':
+        if not output_file.is_file():
+            logger.info(f"Already removed: {output_file}")
+            return
+        read_entity(output_file, entity_ref, change['previousHash'])
+        output_file.unlink()
+        logger.info(f"Removed: {output_file}")
+        return
+    if change['action'] not in ['added', 'modified']:
+        raise ValueError(f"Unknown change action: {change['action']}")
+    if output_file.is_file():
+        with open(output_file, 'r') as f:
+            if compute_entity_hash(yaml.safe_load(f)) == change['hash']:
+                logger.info(f"Already applied: {output_file}")
+                return
+
+    if change['action'] == 'added':
+        document = change['entity']
+    else:
+        document = read_entity(output_file, entity_ref, change['previousHash'])
+        document = apply_patch(document, change['patch'])
+
+    if compute_entity_hash(document) != change['hash']:
+        raise ValueError(f"{entity_ref} does not match hash {change['hash']} after applying the change")
+    write_entity(output_file, document)
+    logger.info(f"{change['action'].capitalize()}: {output_file}")
+
+def feed_sequence(feed_file):
+    """Return the sequence number of a 'changes-<sequence>.jsonl' feed file."""
+    return int(feed_file.stem.split('-', 1)[1])
+
+def load_cursor(cursor_file):
+    """Load the sequence of the last change feed applied to the mirror, if any."""
+    if not cursor_file.is_file():
+        return 0
+    with open(cursor_file, 'r') as f:
+        return int(f.read().strip() or 0)
+
+def apply_change_feed():
+    """Apply every change feed written by the converters since the mirror's cursor, in sequence order."""
+    cursor_file = Path(OUTPUT_DIR) / CURSOR_FILE_NAME
+    cursor = load_cursor(cursor_file)
+    feed_files = sorted(Path(CHANGE_FEED_DIR).glob('changes-*.jsonl'), key=feed_sequence)
+    pending = [feed_file for feed_file in feed_files if feed_sequence(feed_file) > cursor]
+    if not feed_files:
+        logger.error(f"Error: No change feeds found in {CHANGE_FEED_DIR}")
+        sys.exit(1)
+
+    applied = 0
+    for feed_file in pending:
+        with open(feed_file, 'r') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    apply_change(json.loads(line))
+                except (ValueError, KeyError) as e:
+                    logger.error(f"Error: Failed to apply change feed {feed_file}: {e}")
+                    sys.exit(1)
+                applied += 1
+        Path(OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+        with open(cursor_file, 'w') as f:
+            f.write(f"{feed_sequence(feed_file)}\n")
+        logger.info(f"Applied {feed_file}")
+    logger.info(f"Applied {applied} changes from {len(pending)} change feeds to {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    apply_change_feed()
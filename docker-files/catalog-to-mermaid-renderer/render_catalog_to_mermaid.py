@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+import os
+from pathlib import Path
+import yaml
+import re
+import json
+import hashlib
+import logging
+import sys
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Environment variables with validation
+INPUT_DIR = os.getenv('INPUT_DIR')
+OUTPUT_DIR = os.getenv('OUTPUT_DIR')
+
+if not INPUT_DIR:
+    logger.error("Error: INPUT_DIR environment variable is not set.")
+    sys.exit(1)
+if not OUTPUT_DIR:
+    logger.error("Error: OUTPUT_DIR environment variable is not set.")
+    sys.exit(1)
+if not os.path.isdir(INPUT_DIR):
+    logger.error(f"Error: Input directory {INPUT_DIR} does not exist or is not mounted.")
+    sys.exit(1)
+
+RENDER_CACHE_FILE = os.getenv('RENDER_CACHE_FILE', os.path.join(OUTPUT_DIR, '.render_cache.json'))
+
+# Bump when the rendered output changes so cached views are re-rendered
+RENDER_CACHE_VERSION = 3
+
+# Relationship technology written for each API type, chosen so the converters map it back to the same type
+API_TYPE_TECHNOLOGY = {
+    'openapi': 'JSON/HTTP',
+    'grpc': 'gRPC',
+    'graphql': 'GraphQL',
+    'soap': 'SOAP',
+    'websocket': 'WebSocket',
+    'odata': 'OData',
+}
+DEPENDENCY_DESCRIPTION = 'Uses'
+DEPENDENCY_TECHNOLOGY = 'Internal'
+
+def generate_entity_ref(kind, name):
+    """Generate a Backstage entity reference (e.g., 'component:authorization-service')."""
+    return f"{kind}:{name}"
+
+def compute_view_hash(documents):
+    """Compute a stable content hash for the catalog documents making up a view."""
+    canonical = json.dumps([RENDER_CACHE_VERSION, documents], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def load_catalog(catalog_dir):
+    """Load all generated catalog documents, keyed by entity reference."""
+    catalog = {}
+    for catalog_file in sorted(Path(catalog_dir).glob('*/*.yaml')):
+        with open(catalog_file, 'r') as f:
+            document = yaml.safe_load(f)
+        if not isinstance(document, dict) or 'kind' not in document:
+            logger.warning(f"Skipping {catalog_file}: not a catalog entity")
+            continue
+        entity_ref = generate_entity_ref(document['kind'].lower(), document['metadata']['name'])
+        catalog[entity_ref] = document
+    return catalog
+
+def mermaid_id(entity_ref):
+    """Convert an entity reference into a Mermaid element id."""
+    return re.sub(r'\W', '_', entity_ref)
+
+def mermaid_text(text):
+    """Make a value safe for a double-quoted Mermaid argument."""
+    return (text or '').replace('"', "'").replace('\n', ' ')
+
+def display_name(name):
+    """Turn an entity name into a label that sanitizes back to the same name."""
+    return name.replace('-', ' ').title()
+
+def container_of(document, catalog):
+    """Return the container a library belongs to, from its '<container>-library' tag."""
+    for tag in reversed(document['metadata'].get('tags') or []):
+        if tag.endswith('-library') and generate_entity_ref('component', tag[:-len('-library')]) in catalog:
+            return tag[:-len('-library')]
+    return None
+
+def collect_relationships(catalog, users):
+    """Derive (source, target, description, technology, api ref) relationships from the catalog.
+
+    The converters do not record the APIs users consume, so provided APIs without any
+    consumer are drawn as consumed by the first user, which converts back to the same API.
+    """
+    relationships = []
+    providers = {}
+    consumed = set()
+    for entity_ref, document in catalog.items():
+        for api_ref in document['spec'].get('providesApis') or []:
+            providers.setdefault(api_ref, []).append(entity_ref)
+    for entity_ref, document in catalog.items():
+        for dependency_ref in document['spec'].get('dependsOn') or []:
+            if dependency_ref in catalog:
+                relationships.append((entity_ref, dependency_ref, DEPENDENCY_DESCRIPTION, DEPENDENCY_TECHNOLOGY, None))
+        for api_ref in document['spec'].get('consumesApis') or []:
+            consumed.add(api_ref)
+            api = catalog.get(api_ref)
+            if not api or not api['metadata'].get('description'):
+                continue
+            technology = API_TYPE_TECHNOLOGY.get(api['spec'].get('type'), 'JSON/HTTP')
+            for provider_ref in providers.get(api_ref, []):
+                relationships.append((entity_ref, provider_ref, api['metadata']['description'], technology, api_ref))
+    for api_ref, provider_refs in providers.items():
+        api = catalog.get(api_ref)
+        if api_ref in consumed or not users or not api or not api['metadata'].get('description'):
+            continue
+        technology = API_TYPE_TECHNOLOGY.get(api['spec'].get('type'), 'JSON/HTTP')
+        for provider_ref in provider_refs:
+            relationships.append((min(users), provider_ref, api['metadata']['description'], technology, api_ref))
+    return relationships
+
+def build_views(catalog, relationships):
+    """Group catalog entities and relationships into one view per system and one per domain."""
+    system_views = {}
+    for entity_ref, document in catalog.items():
+        system = document['spec'].get('system')
+        if document['kind'].lower() in ['component', 'resource'] and system:
+            system_views.setdefault(system, Path('systems') / f"{system}.mmd")
+    view_systems = {view_file: [system] for system, view_file in system_views.items()}
+    titles = {view_file: f"{display_name(system)} as-built" for system, view_file in system_views.items()}
+    for entity_ref, document in catalog.items():
+        domain = document['spec'].get('domain')
+        if document['kind'].lower() == 'system' and domain and document['metadata']['name'] in system_views:
+            view_file = Path('domains') / f"{domain}.mmd"
+            view_systems.setdefault(view_file, []).append(document['metadata']['name'])
+            titles[view_file] = f"{display_name(domain)} domain as-built"
+
+    views_of_system = {}
+    for view_file, systems in view_systems.items():
+        for system in systems:
+            views_of_system.setdefault(system, []).append(view_file)
+    views = {view_file: (titles[view_file], set(), []) for view_file in view_systems}
+    for entity_ref, document in catalog.items():
+        if document['kind'].lower() in ['component', 'resource']:
+            for view_file in views_of_system.get(document['spec'].get('system'), []):
+                views[view_file][1].add(entity_ref)
+    for rel in relationships:
+        rel_views = set()
+        for entity_ref in rel[:2]:
+            rel_views.update(views_of_system.get(catalog[entity_ref]['spec'].get('system'), []))
+        for view_file in rel_views:
+            views[view_file][2].append(rel)
+    return views
+
+def view_documents(catalog, members, relationships, users):
+    """Return every catalog document a view depends on, keyed by entity reference."""
+    refs = set(members) | users
+    for source, target, _, _, api_ref in relationships:
+        refs.update([source, target])
+        if api_ref:
+            refs.add(api_ref)
+    for entity_ref in list(refs):
+        system = catalog[entity_ref]['spec'].get('system')
+        if system and generate_entity_ref('system', system) in catalog:
+            refs.add(generate_entity_ref('system', system))
+    return {entity_ref: catalog[entity_ref] for entity_ref in sorted(refs)}
+
+def render_container(entity_ref, document, indent):
+    """Render a component or resource as a Mermaid Container or ContainerDb."""
+    element = 'ContainerDb' if document['kind'].lower() == 'resource' else 'Container'
+    return (
+        f"{indent}{element}({mermaid_id(entity_ref)}, \"{display_name(document['metadata']['name'])}\", "
+        f"\"{mermaid_text(document['spec'].get('technology'))}\", \"{mermaid_text(document['metadata'].get('description'))}\")"
+    )
+
+def render_view(title, catalog, users, nodes, relationships):
+    """Render a Mermaid C4Container diagram for a set of entities and relationships."""
+    lines = ['C4Container', f"  title {title}"]
+    for entity_ref in sorted(users):
+        document = catalog[entity_ref]
+        lines.append(
+            f"  Person({mermaid_id(entity_ref)}, \"{display_name(document['metadata']['name'])}\", "
+            f"\"{mermaid_text(document['metadata'].get('description'))}\")"
+        )
+
+    systems = {}
+    for entity_ref in sorted(nodes):
+        systems.setdefault(catalog[entity_ref]['spec'].get('system'), []).append(entity_ref)
+
+    for entity_ref in systems.pop(None, []):
+        lines.append(render_container(entity_ref, catalog[entity_ref], '  '))
+    for system, system_nodes in sorted(systems.items()):
+        label = display_name(system)
+        system_document = catalog.get(generate_entity_ref('system', system))
+        if system_document and system_document['spec'].get('domain'):
+            label = f"{label}, domain: {display_name(system_document['spec']['domain'])}"
+        lines.append(f"  System_Boundary({mermaid_id(generate_entity_ref('system', system))}, \"{label}\") {{")
+
+        containers = {}
+        for entity_ref in system_nodes:
+            document = catalog[entity_ref]
+            container = container_of(document, catalog) if document['spec'].get('type') == 'library' else None
+            containers.setdefault(container, []).append(entity_ref)
+        for entity_ref in containers.pop(None, []):
+            lines.append(render_container(entity_ref, catalog[entity_ref], '    '))
+        for container, container_nodes in sorted(containers.items()):
+            boundary_id = mermaid_id(f"boundary:{container}")
+            lines.append(f"    Boundary({boundary_id}, \"{display_name(container)}\") {{")
+            for entity_ref in container_nodes:
+                lines.append(render_container(entity_ref, catalog[entity_ref], '      '))
+            lines.append('    }')
+        lines.append('  }')
+
+    for source, target, description, technology, _ in relationships:
+        lines.append(
+            f"  Rel({mermaid_id(source)}, {mermaid_id(target)}, \"{mermaid_text(description)}\", \"{technology}\")"
+        )
+    return '\n'.join(lines) + '\n'
+
+def load_render_cache(cache_file):
+    """Load the view hashes recorded by the previous run, if any."""
+    if not os.path.isfile(cache_file):
+        return {}
+    with open(cache_file, 'r') as f:
+        return json.load(f)
+
+def render_catalog_views():
+    """Render Mermaid C4Container views per system and domain, skipping views whose subgraph is unchanged."""
+    catalog = load_catalog(INPUT_DIR)
+    if not catalog:
+        logger.error(f"Error: No catalog files found in {INPUT_DIR}")
+        sys.exit(1)
+
+    users = {entity_ref for entity_ref, document in catalog.items() if document['kind'].lower() == 'user'}
+    relationships = collect_relationships(catalog, users)
+    views = build_views(catalog, relationships)
+    previous_cache = load_render_cache(RENDER_CACHE_FILE)
+    cache = {}
+
+    rendered = 0
+    for view_file, (title, members, view_relationships) in sorted(views.items()):
+        # Users belong to no system, so every system view draws them all; editing a user re-renders every system view
+        view_users = users if view_file.parts[0] == 'systems' else set()
+        documents = view_documents(catalog, members, view_relationships, view_users)
+        view_hash = compute_view_hash(documents)
+        output_file = Path(OUTPUT_DIR) / view_file
+        cache[str(view_file)] = view_hash
+        if previous_cache.get(str(view_file)) == view_hash and output_file.is_file():
+            logger.info(f"Unchanged: {output_file}")
+            continue
+
+        nodes = {ref for ref in documents if documents[ref]['kind'].lower() in ['component', 'resource']}
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w') as f:
+            f.write(render_view(title, catalog, users & set(documents), nodes, view_relationships))
+        logger.info(f"Rendered: {output_file}")
+        rendered += 1
+
+    for view_file in previous_cache:
+        if view_file not in cache:
+            stale_file = Path(OUTPUT_DIR) / view_file
+            if stale_file.is_file():
+                stale_file.unlink()
+                logger.info(f"Removed: {stale_file}")
+
+    Path(RENDER_CACHE_FILE).parent.mkdir(parents=True, exist_ok=True)
+    with open(RENDER_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    logger.info(f"Rendered {rendered} of {len(views)} views into {OUTPUT_DIR}")
+
+if __name__ == "__main__":
+    render_catalog_views()
@@ -43,6 +43,12 @@ case $COMMAND in
     echo "    TEAM_NAME (default: team-a)"
     echo "    OWNER (default: TEAM_NAME)"
     echo "    LIFECYCLE (default: production)"
+    echo "    CLASSIFICATION_RULES_FILE (default: classification_rules.yaml next to the converter)"
+    echo "    READER_THREADS, WRITER_THREADS, PIPELINE_QUEUE_SIZE (default: 4, 4, 16)"
+    echo "    DUPLICATE_DETECTION (default: report; one of report, merge, off)"
+    echo "    DUPLICATE_THRESHOLD (default: 0.8)"
+    echo "    DUPLICATE_ALIAS_FILE (optional: write the alias map of merged duplicates)"
+    echo "    CHANGE_FEED_DIR (optional: write sequence-numbered change feeds and snapshot.json for incremental catalog updates)"
     exit 1
     ;;
 esac
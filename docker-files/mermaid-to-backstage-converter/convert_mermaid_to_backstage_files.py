@@ -5,6 +5,13 @@ import yaml
 import re
 import logging
 import sys
+import json
+import hashlib
+import random
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +35,49 @@ REPO_SLUG = os.getenv('REPO_SLUG', 'org/repo')
 TEAM_NAME = os.getenv('TEAM_NAME', 'team-a')
 OWNER = os.getenv('OWNER', TEAM_NAME)
 LIFECYCLE = os.getenv('LIFECYCLE', 'production')
+CHANGE_FEED_DIR = os.getenv('CHANGE_FEED_DIR')
+
+# Pipeline sizing for overlapping file I/O with parsing and serialization
+pipeline_sizes = {}
+for setting, default in [('READER_THREADS', '4'), ('WRITER_THREADS', '4'), ('PIPELINE_QUEUE_SIZE', '16')]:
+    value = os.getenv(setting, default)
+    try:
+        pipeline_sizes[setting] = int(value)
+    except ValueError:
+        pipeline_sizes[setting] = 0
+    if pipeline_sizes[setting] < 1:
+        logger.error(f"Error: {setting} must be an integer of at least 1, not '{value}'.")
+        sys.exit(1)
+READER_THREADS = pipeline_sizes['READER_THREADS']
+WRITER_THREADS = pipeline_sizes['WRITER_THREADS']
+PIPELINE_QUEUE_SIZE = pipeline_sizes['PIPELINE_QUEUE_SIZE']
+
+# Near-duplicate entity detection: 'report' (default), 'merge' or 'off'
+DUPLICATE_DETECTION = os.getenv('DUPLICATE_DETECTION', 'report').lower()
+DUPLICATE_THRESHOLD = os.getenv('DUPLICATE_THRESHOLD', '0.8')
+DUPLICATE_ALIAS_FILE = os.getenv('DUPLICATE_ALIAS_FILE')
+
+if DUPLICATE_DETECTION not in ['report', 'merge', 'off']:
+    logger.error(f"Error: DUPLICATE_DETECTION must be 'report', 'merge' or 'off', not '{DUPLICATE_DETECTION}'.")
+    sys.exit(1)
+try:
+    threshold = float(DUPLICATE_THRESHOLD)
+except ValueError:
+    threshold = 0.0
+if not 0 < threshold <= 1:
+    logger.error(f"Error: DUPLICATE_THRESHOLD must be a number greater than 0 and at most 1, not '{DUPLICATE_THRESHOLD}'.")
+    sys.exit(1)
+DUPLICATE_THRESHOLD = threshold
+
+# Suffixes that make a longer name token an inflection of a shorter one rather than its expansion
+INFLECTION_SUFFIXES = ['s', 'es', 'ed', 'er', 'ers', 'ing', 'ings', 'ion', 'ions', 'ated', 'ation', 'ations', 'ment', 'ments']
+
+# MinHash LSH parameters for near-duplicate blocking (48 permutations in 8 bands of 6 rows)
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_BANDS = 8
+MINHASH_PREFIX_LENGTH = 4
+MINHASH_SEED = 42
+MINHASH_PERMUTATION_COUNT = 48
 
 # API technology mappings
 API_TECHNOLOGIES = ['json/http', 'grpc', 'graphql', 'soap', 'wsdl', 'odata', 'raml', 'websocket']
@@ -42,38 +92,77 @@ API_TYPE_MAPPING = {
     'raml': 'openapi',
 }
 
-# Infrastructure technologies
-INFRA_TECHNOLOGIES = [
-    'postgresql', 'redis', 'apache kafka', 'hashcorp vault', 'mysql', 'mongodb',
-    's3', 'sns', 'sqs', 'dynamodb', 'elasticsearch', 'rabbitmq', 'activemq',
-    'zeromq', 'nats', 'pubsub', 'servicebus'
-]
+# Technology classification rules
+CLASSIFICATION_RULES_FILE = os.getenv(
+    'CLASSIFICATION_RULES_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'classification_rules.yaml')
+)
+RESOURCE_TYPES = ['database', 'message-queue', 'key-vault', 'infrastructure']
 
-# Specific technology lists for accurate classification
-DATABASE_TECHNOLOGIES = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch']
-MESSAGE_QUEUE_TECHNOLOGIES = ['apache kafka', 'rabbitmq', 'activemq', 'zeromq', 'nats', 'pubsub', 'servicebus']
-KEY_VAULT_TECHNOLOGIES = ['hashcorp vault']
+def compile_keyword_matcher(keywords):
+    """Compile keywords into a single regex matching any of them as a whole word."""
+    alternation = '|'.join(re.escape(keyword.lower()) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(rf"(?<![a-z0-9])(?:{alternation})(?![a-z0-9])")
+
+def load_classification_rules(rules_file):
+    """Load technology classification rules from a YAML rule file and compile their matchers."""
+    if not os.path.isfile(rules_file):
+        logger.error(f"Error: Classification rules file {rules_file} does not exist.")
+        sys.exit(1)
+    with open(rules_file, 'r') as f:
+        rules = (yaml.safe_load(f) or {}).get('technologies', [])
+    if not rules:
+        logger.error(f"Error: Classification rules file {rules_file} defines no technologies.")
+        sys.exit(1)
+
+    pattern_rules = {}
+    for index, rule in enumerate(rules):
+        if not rule.get('match'):
+            logger.error(f"Error: Classification rule {rule.get('name', index)} in {rules_file} has no match patterns.")
+            sys.exit(1)
+        for pattern in rule['match']:
+            pattern_rules.setdefault(pattern.lower(), index)
+        for entity_type, refinement in rule.get('refine', {}).items():
+            blocks = [refinement] + ([refinement['description']] if refinement.get('description') else [])
+            if any('technology' not in block or 'tags' not in block for block in blocks):
+                logger.error(
+                    f"Error: Classification rule {rule.get('name', index)} in {rules_file} has a {entity_type} refinement without technology and tags."
+                )
+                sys.exit(1)
+            if refinement.get('description'):
+                if not refinement['description'].get('match'):
+                    logger.error(
+                        f"Error: Classification rule {rule.get('name', index)} in {rules_file} has a {entity_type} description refinement with no match patterns."
+                    )
+                    sys.exit(1)
+                refinement['description']['matcher'] = compile_keyword_matcher(refinement['description']['match'])
+    return rules, compile_keyword_matcher(pattern_rules), pattern_rules
+
+TECHNOLOGY_RULES, TECHNOLOGY_MATCHER, TECHNOLOGY_PATTERNS = load_classification_rules(CLASSIFICATION_RULES_FILE)
+
+def match_technology(tech):
+    """Return the highest-priority rule with a pattern appearing as a whole word in a technology."""
+    indexes = [TECHNOLOGY_PATTERNS[match.group(0)] for match in TECHNOLOGY_MATCHER.finditer(tech.lower())]
+    return TECHNOLOGY_RULES[min(indexes)] if indexes else None
+
+def lookup_technology(tech):
+    """Return the rule with a pattern matching the whole technology, if any."""
+    match = TECHNOLOGY_MATCHER.fullmatch(tech.lower())
+    return TECHNOLOGY_RULES[TECHNOLOGY_PATTERNS[match.group(0)]] if match else None
+
+def classify_technology(tech):
+    """Return the (kind, type) a technology classifies as, or (None, None) when no rule sets a kind."""
+    rule = lookup_technology(tech)
+    if rule and rule.get('kind'):
+        return rule['kind'], rule.get('type', 'service')
+    return None, None
 
 def standardize_technology(tech):
     """Standardize technology names to their proper casing."""
-    tech_lower = tech.lower()
-    KNOWN_TECHNOLOGIES = {
-        'postgresql': 'PostgreSQL',
-        'postgres': 'PostgreSQL',
-        'redis': 'Redis',
-        'apache kafka': 'Apache Kafka',
-        'kafka': 'Apache Kafka',
-        'hashcorp vault': 'HashiCorp Vault',
-        'vault': 'HashiCorp Vault',
-        'mysql': 'MySQL',
-        'mongodb': 'MongoDB',
-        'spring': 'Spring Framework',
-        'spring boot': 'Spring Boot',
-        'react': 'React',
-        'angular': 'Angular',
-        'kong': 'Kong',
-    }
-    return KNOWN_TECHNOLOGIES.get(tech_lower, tech.capitalize())
+    rule = lookup_technology(tech)
+    if rule and rule.get('name'):
+        return rule['name']
+    return tech.capitalize()
 
 def sanitize_name(name):
     """Convert a name to a lowercase, hyphen-separated string."""
@@ -94,38 +183,28 @@ def refine_tags_and_technology(entity, container_name=None):
     description = entity.get('description', '').lower()
     tags = [tech] if tech else []
 
-    if entity['type'] == 'service':
-        if 'spring' in tech or 'spring boot' in tech:
-            tags = ['spring-service']
-            entity['technology'] = 'Spring Boot Service'
-        elif 'react' in tech:
-            tags = ['react']
-            entity['technology'] = 'React'
-        elif 'angular' in tech:
-            tags = ['angular']
-            entity['technology'] = 'Angular'
-        elif 'kong' in tech:
-            tags = ['kong']
-            entity['technology'] = 'Kong'
-    elif entity['type'] == 'library':
-        if 'spring' in tech:
-            tags = ['spring-library']
-            entity['technology'] = 'Spring Framework'
-            if 'database' in description or 'postgres' in description:
-                tags.extend(['spring-data', 'database-library'])
-                entity['technology'] = 'Spring Data JPA'
+    rule = match_technology(tech)
+    refinement = rule.get('refine', {}).get(entity['type']) if rule else None
+    if refinement:
+        tags = list(refinement['tags'])
+        entity['technology'] = refinement['technology']
+        description_refinement = refinement.get('description')
+        if description_refinement and description_refinement['matcher'].search(description):
+            tags.extend(description_refinement['tags'])
+            entity['technology'] = description_refinement['technology']
+
+    if entity['type'] == 'library':
         if container_name:
             tags.append(f"{container_name}-library")
-    elif entity['type'] in ['database', 'message-queue', 'key-vault', 'infrastructure']:
+    elif entity['type'] in RESOURCE_TYPES:
         entity['technology'] = standardize_technology(tech)
 
     entity['tags'] = tags
     return entity
 
-def parse_mermaid_file(mmd_file):
-    """Parse a Mermaid file to extract entities and relationships."""
-    with open(mmd_file, 'r') as f:
-        code = f.read().strip()
+def parse_mermaid_file(mmd_content):
+    """Parse the content of a Mermaid file to extract entities and relationships."""
+    code = mmd_content.strip()
 
     lines = code.split('\n')
     entities = {}
@@ -165,11 +244,11 @@ def parse_mermaid_file(mmd_file):
                     stack.append({'type': 'boundary', 'name': current_container})
                 continue
         elif line == '}':
-            if stack:
-                stack.pop()
+            if stack and stack.pop().get('type') == 'boundary':
+                current_container = next((item['name'] for item in reversed(stack) if item.get('type') == 'boundary'), None)
         else:
             if line.startswith('Person('):
-                match = re.match(r'Person\((\w+),\s*"(.+)",\s*"(.+)"\)', line)
+                match = re.match(r'Person\((\w+),\s*"(.+)",\s*"(.*)"\)', line)
                 if match:
                     id, name, description = match.groups()
                     name = sanitize_name(name)
@@ -183,25 +262,19 @@ def parse_mermaid_file(mmd_file):
                     entities[id] = entity
                     id_to_key[id] = key
             elif line.startswith('Container(') or line.startswith('ContainerDb('):
-                match = re.match(r'(Container|ContainerDb)\((\w+),\s*"(.+)",\s*"(.+)",\s*"(.+)"\)', line)
+                match = re.match(r'(Container|ContainerDb)\((\w+),\s*"(.+)",\s*"(.*)",\s*"(.*)"\)', line)
                 if match:
                     container_type, id, name, technology, description = match.groups()
                     name = sanitize_name(name)
                     kind = 'component' if container_type == 'Container' else 'resource'
                     entity_type = 'service' if container_type == 'Container' else 'database'
-                    tech_lower = technology.lower()
-                    if tech_lower in INFRA_TECHNOLOGIES or container_type == 'ContainerDb':
+                    tech_kind, tech_type = classify_technology(technology)
+                    if tech_kind == 'resource' or container_type == 'ContainerDb':
                         kind = 'resource'
-                        if tech_lower in DATABASE_TECHNOLOGIES:
-                            entity_type = 'database'
-                        elif tech_lower in MESSAGE_QUEUE_TECHNOLOGIES:
-                            entity_type = 'message-queue'
-                        elif tech_lower in KEY_VAULT_TECHNOLOGIES:
-                            entity_type = 'key-vault'
-                        else:
-                            entity_type = 'infrastructure'
-                    elif tech_lower in ['angular', 'react']:
-                        entity_type = 'website'
+                        entity_type = tech_type if tech_kind == 'resource' else 'infrastructure'
+                    elif tech_kind:
+                        kind = tech_kind
+                        entity_type = tech_type
                     system = next((item['name'] for item in reversed(stack) if item.get('kind') == 'system'), None)
                     entity = {
                         'kind': kind,
@@ -273,6 +346,348 @@ def process_relationships(entities, relationships):
                 if dep_ref not in source['dependsOn']:
                     source['dependsOn'].append(dep_ref)
 
+def merge_entity(existing, entity):
+    """Merge an entity into an existing entity with the same identity."""
+    if len(entity.get('description', '')) > len(existing.get('description', '')):
+        existing['description'] = entity['description']
+    if entity.get('technology') and not existing.get('technology'):
+        existing['technology'] = entity['technology']
+    for field in ['dependsOn', 'providesApis', 'consumesApis']:
+        if entity.get(field):
+            refs = existing.setdefault(field, [])
+            refs.extend([ref for ref in entity[field] if ref not in refs])
+    if 'domain' in entity and 'domain' not in existing:
+        existing['domain'] = entity['domain']
+
+def generate_minhash_permutations(count, seed):
+    """Generate deterministic (a, b) pairs for the MinHash hash functions (a * h + b) mod p."""
+    generator = random.Random(seed)
+    return [(generator.randrange(1, MINHASH_PRIME), generator.randrange(0, MINHASH_PRIME)) for _ in range(count)]
+
+MINHASH_PERMUTATIONS = generate_minhash_permutations(MINHASH_PERMUTATION_COUNT, MINHASH_SEED)
+
+def normalize_name_tokens(name):
+    """Split a name into lowercase alphanumeric tokens (e.g., 'Auth-Service ' -> ['auth', 'service'])."""
+    return re.findall(r'[a-z0-9]+', name.lower())
+
+def compute_minhash(shingles):
+    """Compute a MinHash signature over a set of shingles."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        for shingle in shingles
+    ]
+    return tuple(min((a * h + b) % MINHASH_PRIME for h in hashes) for a, b in MINHASH_PERMUTATIONS)
+
+def build_blocking_index(entities, tokens):
+    """Bucket entity keys by kind and MinHash LSH bands over the token prefixes of their names.
+
+    Shingling on token prefixes lets abbreviations such as 'auth' and 'authorization'
+    land in the same buckets, so only names sharing most of their tokens are compared.
+    """
+    buckets = {}
+    rows = len(MINHASH_PERMUTATIONS) // MINHASH_BANDS
+    for key in entities:
+        shingles = {token[:MINHASH_PREFIX_LENGTH] for token in tokens[key]}
+        if not shingles:
+            continue
+        signature = compute_minhash(shingles)
+        for band in range(MINHASH_BANDS):
+            bucket = (key[0], band, signature[band * rows:(band + 1) * rows])
+            buckets.setdefault(bucket, []).append(key)
+    return buckets
+
+def is_abbreviation(short, long):
+    """Check that a token abbreviates a longer one (e.g., 'auth' and 'authorization') rather than inflects it."""
+    return (
+        len(short) >= 3
+        and 2 * len(short) <= len(long)
+        and long.startswith(short)
+        and long[len(short):] not in INFLECTION_SUFFIXES
+    )
+
+def name_similarity(tokens_a, tokens_b):
+    """Score two token lists by the share of tokens that are equal or abbreviate each other.
+
+    Every token of the shorter name must be matched, so names that differ by a
+    substituted word (e.g., 'valid-token' and 'expired-token') score 0.
+    """
+    if ''.join(tokens_a) == ''.join(tokens_b):
+        return 1.0
+    unmatched = list(tokens_b)
+    matched = 0
+    for token in tokens_a:
+        for other in unmatched:
+            if token == other or is_abbreviation(token, other) or is_abbreviation(other, token):
+                unmatched.remove(other)
+                matched += 1
+                break
+    if matched < min(len(tokens_a), len(tokens_b)):
+        return 0.0
+    return matched / max(len(tokens_a), len(tokens_b))
+
+def is_duplicate_candidate(entities, key_a, key_b, providers):
+    """Check that two candidates share their system, technology and, for APIs, their providers."""
+    for field in ['system', 'technology']:
+        value_a = (entities[key_a].get(field) or '').lower()
+        value_b = (entities[key_b].get(field) or '').lower()
+        if value_a and value_b and value_a != value_b:
+            return False
+    if key_a[0] == 'api':
+        return providers.get(generate_entity_ref(*key_a), set()) == providers.get(generate_entity_ref(*key_b), set())
+    return True
+
+def find_duplicate_entities(entities):
+    """Find likely duplicate entity pairs, comparing only candidates that share a blocking bucket."""
+    tokens = {key: normalize_name_tokens(key[1]) for key in entities}
+    providers = {}
+    for key, entity in entities.items():
+        for api_ref in entity.get('providesApis') or []:
+            providers.setdefault(api_ref, set()).add(key)
+    compared = set()
+    duplicates = []
+    for keys in build_blocking_index(entities, tokens).values():
+        for i, key_a in enumerate(keys):
+            for key_b in keys[i + 1:]:
+                if (key_a, key_b) in compared:
+                    continue
+                compared.add((key_a, key_b))
+                if not is_duplicate_candidate(entities, key_a, key_b, providers):
+                    continue
+                score = name_similarity(tokens[key_a], tokens[key_b])
+                if score >= DUPLICATE_THRESHOLD:
+                    duplicates.append((key_a, key_b, score))
+    return duplicates
+
+def resolve_duplicate_aliases(entities, duplicates):
+    """Group duplicate pairs and map every alias key to the first-seen entity key of its group.
+
+    Groups are only merged when every pair in them is a duplicate, so one short name
+    that abbreviates two different names does not chain them into a single entity.
+    """
+    order = {key: index for index, key in enumerate(entities)}
+    pairs = {frozenset([key_a, key_b]) for key_a, key_b, _ in duplicates}
+    parents = {}
+
+    def find(key):
+        while parents.get(key, key) != key:
+            key = parents[key]
+        return key
+
+    for key_a, key_b, _ in duplicates:
+        root_a, root_b = find(key_a), find(key_b)
+        if root_a != root_b:
+            canonical, alias = sorted([root_a, root_b], key=order.get)
+            parents[alias] = canonical
+
+    groups = {}
+    for key in sorted({key for pair in pairs for key in pair}, key=order.get):
+        groups.setdefault(find(key), []).append(key)
+    aliases = {}
+    for canonical, group in groups.items():
+        if any(frozenset([key_a, key_b]) not in pairs for i, key_a in enumerate(group) for key_b in group[i + 1:]):
+            refs = ', '.join(generate_entity_ref(*key) for key in group)
+            logger.warning(f"Not merging ambiguous duplicate group: {refs}")
+            continue
+        aliases.update({alias: canonical for alias in group[1:]})
+    return aliases
+
+def detect_duplicate_entities(entities):
+    """Report likely duplicate entities and, in merge mode, merge them and return the alias map."""
+    if DUPLICATE_DETECTION == 'off':
+        return {}
+
+    duplicates = find_duplicate_entities(entities)
+    for key_a, key_b, score in duplicates:
+        logger.warning(
+            f"Possible duplicate entities: {generate_entity_ref(*key_a)} and {generate_entity_ref(*key_b)} (similarity {score:.2f})"
+        )
+    if DUPLICATE_DETECTION != 'merge':
+        return {}
+
+    aliases = resolve_duplicate_aliases(entities, duplicates)
+    for alias, canonical in aliases.items():
+        merge_entity(entities[canonical], entities.pop(alias))
+        logger.info(f"Merged duplicate entity {generate_entity_ref(*alias)} into {generate_entity_ref(*canonical)}")
+    if DUPLICATE_ALIAS_FILE:
+        alias_map = {generate_entity_ref(*alias): generate_entity_ref(*canonical) for alias, canonical in aliases.items()}
+        with open(DUPLICATE_ALIAS_FILE, 'w') as f:
+            yaml.dump(alias_map, f, default_flow_style=False)
+        logger.info(f"Generated alias map: {DUPLICATE_ALIAS_FILE}")
+    return aliases
+
+def apply_entity_aliases(entities, aliases):
+    """Rewrite entity references and systems from merged duplicates to their canonical entities."""
+    ref_aliases = {generate_entity_ref(*alias): generate_entity_ref(*canonical) for alias, canonical in aliases.items()}
+    for (kind, name), entity in entities.items():
+        own_ref = generate_entity_ref(kind, name)
+        for field in ['dependsOn', 'providesApis', 'consumesApis']:
+            if field not in entity:
+                continue
+            refs = []
+            for ref in entity[field]:
+                ref = ref_aliases.get(ref, ref)
+                if ref != own_ref and ref not in refs:
+                    refs.append(ref)
+            entity[field] = refs
+        canonical_system = aliases.get(('system', entity.get('system')))
+        if canonical_system:
+            entity['system'] = canonical_system[1]
+
+def read_input_files(input_files):
+    """Read input files through a pool of reader threads, yielding (path, content) in input order.
+
+    At most PIPELINE_QUEUE_SIZE files are read ahead of the parser, so slow storage
+    overlaps with parsing while memory stays bounded.
+    """
+    with ThreadPoolExecutor(max_workers=READER_THREADS) as executor:
+        pending = deque()
+        for input_file in input_files:
+            if len(pending) >= PIPELINE_QUEUE_SIZE:
+                yield pending.popleft().result()
+            pending.append(executor.submit(read_input_file, input_file))
+        while pending:
+            yield pending.popleft().result()
+
+def read_input_file(input_file):
+    """Read a single input file."""
+    with open(input_file, 'r') as f:
+        return input_file, f.read()
+
+def serialize_catalog_documents(catalog_documents):
+    """Serialize catalog documents to YAML, yielding (output file, content) pairs."""
+    for entity_ref, document in catalog_documents.items():
+        kind, name = entity_ref.split(':', 1)
+        output_file = Path(OUTPUT_DIR) / f"{kind}s" / f"{name}.yaml"
+        yield output_file, yaml.dump(document, default_flow_style=False)
+
+def write_output_files(output_files):
+    """Write (output file, content) pairs through a pool of writer threads fed by a bounded queue."""
+    write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    errors = []
+
+    def writer():
+        while True:
+            item = write_queue.get()
+            if item is None:
+                return
+            output_file, content = item
+            try:
+                output_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_file, 'w') as f:
+                    f.write(content)
+                logger.info(f"Generated: {output_file}")
+            except Exception as e:
+                errors.append(e)
+
+    writers = [threading.Thread(target=writer) for _ in range(WRITER_THREADS)]
+    for thread in writers:
+        thread.start()
+    try:
+        for item in output_files:
+            write_queue.put(item)
+    finally:
+        for _ in writers:
+            write_queue.put(None)
+        for thread in writers:
+            thread.join()
+
+    if errors:
+        for error in errors:
+            logger.error(f"Error: Failed to write catalog file: {error}")
+        sys.exit(1)
+
+def compute_entity_hash(document):
+    """Compute a stable content hash for a generated catalog document."""
+    canonical = json.dumps(document, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def escape_pointer_token(token):
+    """Escape a key for use in a JSON Pointer path (RFC 6901)."""
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+def diff_entity(old, new, path=''):
+    """Build JSON Patch operations (RFC 6902) turning one catalog document into another."""
+    operations = []
+    for key in old:
+        if key not in new:
+            operations.append({'op': 'remove', 'path': f"{path}/{escape_pointer_token(key)}"})
+    for key, value in new.items():
+        key_path = f"{path}/{escape_pointer_token(key)}"
+        if key not in old:
+            operations.append({'op': 'add', 'path': key_path, 'value': value})
+        elif old[key] != value:
+            if isinstance(old[key], dict) and isinstance(value, dict):
+                operations.extend(diff_entity(old[key], value, key_path))
+            else:
+                operations.append({'op': 'replace', 'path': key_path, 'value': value})
+    return operations
+
+def load_snapshot(snapshot_file):
+    """Load the feed sequence and entity snapshot written by the previous run, if any."""
+    if not snapshot_file.is_file():
+        return 0, {}
+    with open(snapshot_file, 'r') as f:
+        snapshot = json.load(f)
+    return snapshot['sequence'], snapshot['entities']
+
+def build_change_feed(previous, current):
+    """Compare two snapshots by hash and return added, removed and modified change records."""
+    changes = []
+    for entity_ref, entry in current.items():
+        old_entry = previous.get(entity_ref)
+        if old_entry is None:
+            changes.append({'action': 'added', 'entityRef': entity_ref, 'hash': entry['hash'], 'entity': entry['entity']})
+        elif old_entry['hash'] != entry['hash']:
+            changes.append({
+                'action': 'modified',
+                'entityRef': entity_ref,
+                'previousHash': old_entry['hash'],
+                'hash': entry['hash'],
+                'patch': diff_entity(old_entry['entity'], entry['entity'])
+            })
+    for entity_ref, old_entry in previous.items():
+        if entity_ref not in current:
+            changes.append({'action': 'removed', 'entityRef': entity_ref, 'previousHash': old_entry['hash']})
+    return changes
+
+def write_change_feed(catalog_documents):
+    """Append a sequence-numbered change feed against the previous snapshot and replace the snapshot.
+
+    Feeds are never overwritten, so a consumer that missed runs can catch up by
+    applying every feed after the last sequence it applied.
+    """
+    feed_dir = Path(CHANGE_FEED_DIR)
+    feed_dir.mkdir(parents=True, exist_ok=True)
+    snapshot_file = feed_dir / 'snapshot.json'
+
+    sequence, previous = load_snapshot(snapshot_file)
+    # Continue after any feed still on disk, so a lost snapshot never reuses a sequence a consumer has applied
+    feed_sequences = [int(feed_file.stem.split('-', 1)[1]) for feed_file in feed_dir.glob('changes-*.jsonl')]
+    sequence = max([sequence] + feed_sequences)
+    if feed_sequences and not snapshot_file.is_file():
+        logger.warning(
+            f"No snapshot.json in {feed_dir}; change feed {sequence + 1} lists every entity as added and cannot report removals"
+        )
+    current = {
+        entity_ref: {'hash': compute_entity_hash(document), 'entity': document}
+        for entity_ref, document in catalog_documents.items()
+    }
+    changes = build_change_feed(previous, current)
+    if not changes:
+        logger.info(f"No catalog changes since change feed {sequence}")
+        return
+
+    sequence += 1
+    feed_file = feed_dir / f"changes-{sequence:08d}.jsonl"
+    with open(feed_file, 'w') as f:
+        for change in changes:
+            f.write(json.dumps(change, sort_keys=True) + '\n')
+    with open(snapshot_file, 'w') as f:
+        json.dump({'sequence': sequence, 'entities': current}, f, sort_keys=True)
+
+    counts = {action: sum(1 for change in changes if change['action'] == action) for action in ['added', 'removed', 'modified']}
+    logger.info(f"Generated change feed: {feed_file} ({counts['added']} added, {counts['removed']} removed, {counts['modified']} modified)")
+
 def generate_catalog_files():
     """Generate Backstage catalog YAML files from all Mermaid files."""
     mmd_files = list(Path(INPUT_DIR).rglob('*.mmd'))
@@ -282,24 +697,22 @@ def generate_catalog_files():
 
     all_entities = {}
     all_relationships = []
-    for mmd_file in mmd_files:
-        entities, relationships = parse_mermaid_file(mmd_file)
+    for _, mmd_content in read_input_files(mmd_files):
+        entities, relationships = parse_mermaid_file(mmd_content)
         all_relationships.extend(relationships)
         for entity_id, entity in entities.items():
             key = (entity['kind'], entity['name'])
             if key not in all_entities:
                 all_entities[key] = entity
             else:
-                existing = all_entities[key]
-                if len(entity.get('description', '')) > len(existing.get('description', '')):
-                    existing['description'] = entity['description']
-                if entity.get('technology') and not existing.get('technology'):
-                    existing['technology'] = entity['technology']
-                if 'domain' in entity and 'domain' not in existing:
-                    existing['domain'] = entity['domain']
+                merge_entity(all_entities[key], entity)
 
     process_relationships(all_entities, all_relationships)
 
+    aliases = detect_duplicate_entities(all_entities)
+    if aliases:
+        apply_entity_aliases(all_entities, aliases)
+
     group_name = sanitize_name(TEAM_NAME)
     all_entities[('group', group_name)] = {
         'kind': 'group',
@@ -323,11 +736,8 @@ def generate_catalog_files():
         container_name = entity.get('container')
         entity = refine_tags_and_technology(entity, container_name)
 
+    catalog_documents = {}
     for (kind, name), entity in all_entities.items():
-        output_dir = Path(OUTPUT_DIR) / f"{kind}s"
-        output_file = output_dir / f"{name}.yaml"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
         yaml_data = {
             'apiVersion': 'backstage.io/v1alpha1',
             'kind': entity['kind'].capitalize(),
@@ -363,9 +773,12 @@ def generate_catalog_files():
             if entity.get('technology') and entity['kind'] != 'api':
                 yaml_data['spec']['technology'] = entity['technology']
 
-        with open(output_file, 'w') as f:
-            yaml.dump(yaml_data, f, default_flow_style=False)
-        logger.info(f"Generated: {output_file}")
+        catalog_documents[generate_entity_ref(kind, name)] = yaml_data
+
+    write_output_files(serialize_catalog_documents(catalog_documents))
+
+    if CHANGE_FEED_DIR:
+        write_change_feed(catalog_documents)
 
 if __name__ == "__main__":
     generate_catalog_files()